@@ -2627,9 +2627,20 @@ def display_wallet_info(payment_address, owner_address, data_public_key, config_
     if data_public_key is not None:
         print('Data public key:\t{}'.format(data_public_key))
 
-    balance = None
+    # look up the balance and the names owned in parallel
+    sg = ScatterGather()
     if payment_address is not None:
-        balance = get_balance( payment_address, config_path=config_path )
+        sg.add_task('balance', lambda: get_balance( payment_address, config_path=config_path ))
+
+    if owner_address is not None:
+        sg.add_task('names_owned', lambda: get_names_owned(owner_address))
+
+    sg.run_tasks()
+    results = sg.get_results()
+
+    balance = results.get('balance', None)
+    if isinstance(balance, dict) and 'error' in balance:
+        balance = None
 
     if balance is None:
         print('Failed to look up balance')
@@ -2640,16 +2651,12 @@ def display_wallet_info(payment_address, owner_address, data_public_key, config_
         print('{}: {}'.format(payment_address, balance))
         print('-' * 60)
 
-    names_owned = None
-    if owner_address is not None:
-        names_owned = get_names_owned(owner_address)
-        
+    names_owned = results.get('names_owned', None)
     if names_owned is None or 'error' in names_owned:
         print('Failed to look up names owned')
 
     else:
         print('Names Owned:')
-        names_owned = get_names_owned(owner_address)
         print('{}: {}'.format(owner_address, names_owned))
         print('-' * 60)
 
@@ -271,6 +271,35 @@ def get_balance(address, config_path=CONFIG_PATH, utxo_client=None, min_confirma
     return satoshi_amount
 
 
+def get_confirmed_and_total_balance(address, config_path=CONFIG_PATH):
+    """
+    Get both the confirmed balance (UTXOs with at least one confirmation)
+    and the total balance (including unconfirmed UTXOs) of an address,
+    using a single UTXO query instead of one query per balance.
+
+    Returns (confirmed satoshis, total satoshis) on success
+    Return (None, None) on failure
+    """
+
+    data = get_utxos(address, config_path=config_path, min_confirmations=0)
+    if 'error' in data:
+        log.error("Failed to get UTXOs for %s: %s" % (address, data['error']))
+        return (None, None)
+
+    satoshis_confirmed = 0
+    satoshis_total = 0
+
+    for utxo in data:
+        if 'value' not in utxo:
+            continue
+
+        satoshis_total += utxo['value']
+        if int(utxo['confirmations']) >= 1:
+            satoshis_confirmed += utxo['value']
+
+    return (satoshis_confirmed, satoshis_total)
+
+
 def is_address_usable(address, config_path=CONFIG_PATH, utxo_client=None, min_confirmations=None):
     """
     Check if an address is usable (i.e. it has no unconfirmed transactions).
@@ -253,7 +253,8 @@ def storage_init(conf, **kw):
 
 
 def handles_url( url ):
-    if (url.startswith("http://") or url.startswith("https://")) and len(url.split("#")) == 2 and url.split("#")[0].endswith("/RPC2"):
+    # exactly one '#', preceded by the xmlrpc endpoint
+    if (url.startswith("http://") or url.startswith("https://")) and url.count("#") == 1 and url[:url.find("#")].endswith("/RPC2"):
         return True
     else:
         return False
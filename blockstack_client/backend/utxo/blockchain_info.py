@@ -62,10 +62,13 @@ def format_unspents(unspents):
         for s in unspents
     ]
 
-def get_unspents(address, blockchain_client=BlockchainInfoClient()):
+def get_unspents(address, blockchain_client=None):
     """ Get the spendable transaction outputs, also known as UTXOs or
         unspent transaction outputs.
     """
+    if blockchain_client is None:
+        blockchain_client = BlockchainInfoClient()
+
     if not isinstance(blockchain_client, BlockchainInfoClient):
         raise Exception('A BlockchainInfoClient object is required')
 
@@ -84,9 +87,12 @@ def get_unspents(address, blockchain_client=BlockchainInfoClient()):
     return format_unspents(unspents)
 
 
-def broadcast_transaction(hex_tx, blockchain_client=BlockchainInfoClient()):
+def broadcast_transaction(hex_tx, blockchain_client=None):
     """ Dispatch a raw transaction to the network.
     """
+    if blockchain_client is None:
+        blockchain_client = BlockchainInfoClient()
+
     url = BLOCKCHAIN_API_BASE_URL + '/pushtx'
     payload = {'tx': hex_tx}
     r = requests.post(url, data=payload, auth=blockchain_client.auth, timeout=blockchain_client.timeout)
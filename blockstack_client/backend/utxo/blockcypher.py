@@ -59,10 +59,13 @@ def format_unspents(unspents):
     ]
 
 
-def get_unspents(address, blockchain_client=BlockcypherClient()):
+def get_unspents(address, blockchain_client=None):
     """ Get the spendable transaction outputs, also known as UTXOs or
         unspent transaction outputs.
     """
+    if blockchain_client is None:
+        blockchain_client = BlockcypherClient()
+
     if not isinstance(blockchain_client, BlockcypherClient):
         raise Exception('A BlockcypherClient object is required')
 
@@ -55,7 +55,7 @@ from .profile import get_data_privkey_info
 
 from .proxy import (
     getinfo, get_name_blockchain_history, get_default_proxy, json_is_error)
-from .storage import hash_zonefile
+from .storage import serialize_zonefile
 from .zonefile import get_name_zonefile, load_name_zonefile, store_name_zonefile
 from .utils import ScatterGather
 
@@ -1099,7 +1099,7 @@ def put_immutable(blockchain_id, data_id, data_text, data_url=None, txid=None, p
     if not rc:
         return {'error': 'Failed to insert immutable data into user zonefile'}
 
-    zonefile_hash = hash_zonefile(user_zonefile)
+    user_zonefile_txt, zonefile_hash = serialize_zonefile(user_zonefile)
 
     # update zonefile, if we haven't already
     if txid is None:
@@ -1111,8 +1111,6 @@ def put_immutable(blockchain_id, data_id, data_text, data_url=None, txid=None, p
             wallet_keys=wallet_keys, config_path=proxy.conf['path']
         )
 
-        user_zonefile_txt = blockstack_zones.make_zone_file(user_zonefile)
-
         update_result = async_update(
             blockchain_id, user_zonefile_txt, None, owner_privkey_info,
             payment_privkey_info, config_path=proxy.conf['path'],
@@ -1394,7 +1392,7 @@ def delete_immutable(blockchain_id, data_key, data_id=None, proxy=None, txid=Non
     # remove
     user_db.remove_immutable_data_zonefile(user_zonefile, data_key)
 
-    zonefile_hash = hash_zonefile(user_zonefile)
+    user_zonefile_txt, zonefile_hash = serialize_zonefile(user_zonefile)
 
     if txid is None:
         # actually send the transaction
@@ -1406,8 +1404,6 @@ def delete_immutable(blockchain_id, data_key, data_id=None, proxy=None, txid=Non
             wallet_keys=wallet_keys, config_path=proxy.conf['path']
         )
 
-        user_zonefile_txt = blockstack_zones.make_zone_file(user_zonefile)
-
         update_result = async_update(
             blockchain_id, user_zonefile_txt, None, owner_privkey_info,
             payment_privkey_info, config_path=proxy.conf['path'],
@@ -1568,7 +1564,7 @@ def set_data_pubkey(blockchain_id, data_pubkey, proxy=None, wallet_keys=None, tx
     user_zonefile = user_zonefile['zonefile']
 
     user_zonefile = user_db.user_zonefile_set_data_pubkey(user_zonefile, data_pubkey)
-    zonefile_hash = hash_zonefile(user_zonefile)
+    user_zonefile_txt, zonefile_hash = serialize_zonefile(user_zonefile)
 
     # update zonefile, if we haven't already
     if txid is None:
@@ -1580,8 +1576,6 @@ def set_data_pubkey(blockchain_id, data_pubkey, proxy=None, wallet_keys=None, tx
             wallet_keys=wallet_keys, config_path=proxy.conf['path']
         )
 
-        user_zonefile_txt = blockstack_zones.make_zone_file(user_zonefile)
-
         update_result = async_update(
             blockchain_id, user_zonefile_txt, None, owner_privkey_info,
             payment_privkey_info, config_path=proxy.conf['path'],
@@ -46,6 +46,9 @@ log = get_logger()
 KEY_CACHE = {}
 KEYCHAIN_CACHE = {}
 
+# maps hex_privkey:chaincode --> {key_index: child_address}
+ADDRESS_CACHE = {}
+
 class HDWallet(object):
     """
     Initialize a hierarchical deterministic wallet with
@@ -150,13 +153,24 @@ class HDWallet(object):
         child address for given @index
         """
 
+        global ADDRESS_CACHE
+
         if self.child_addresses is not None:
             return self.child_addresses[index]
 
+        if ADDRESS_CACHE.has_key(self.keychain_key) and ADDRESS_CACHE[self.keychain_key].has_key(index):
+            return ADDRESS_CACHE[self.keychain_key][index]
+
         # force decompressed...
         hex_privkey = self.get_child_privkey(index)
         hex_pubkey = get_pubkey_hex(hex_privkey)
-        return virtualchain.address_reencode(keylib.public_key_to_address(hex_pubkey))
+        child_address = virtualchain.address_reencode(keylib.public_key_to_address(hex_pubkey))
+
+        if not ADDRESS_CACHE.has_key(self.keychain_key):
+            ADDRESS_CACHE[self.keychain_key] = {}
+
+        ADDRESS_CACHE[self.keychain_key][index] = child_address
+        return child_address
 
 
     def get_child_keypairs(self, count=1, offset=0, include_privkey=False, compressed=True):
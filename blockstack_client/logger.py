@@ -58,15 +58,11 @@ class NetworkLogFormatter( logging.Formatter ):
     }
 
     def format(self, record):
-        msg = record.msg
-        if msg is None:
-            msg = ' '
-
         data = {
             'time': int(time.time()),
             'level': NetworkLogFormatter.level_names.get(record.levelno, 'TRACE'),
             'category': os.path.basename(record.pathname),
-            'message': record.msg,
+            'message': record.getMessage(),
         }
         return data
 
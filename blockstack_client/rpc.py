@@ -2374,13 +2374,14 @@ class BlockstackAPIEndpointHandler(SimpleHTTPRequestHandler):
                                      status_code = 400 )
         if get_address != address:
             log.debug("Re-encode {} to {}".format(address, get_address))
-        # step 1, get the confirmed balance
-        satoshis_confirmed = self._get_confirmed_balance(get_address)
-        # step 2, get total balance
-        satoshis_total = backend_blockchain.get_balance(
-            get_address, config_path = self.server.config_path,
-            min_confirmations = 0)
-        # step 3 -> unconfirmed balance = total - confirmed.
+        # step 1, get the confirmed and total balance from one UTXO query
+        satoshis_confirmed, satoshis_total = backend_blockchain.get_confirmed_and_total_balance(
+            get_address, config_path = self.server.config_path)
+        if satoshis_confirmed is None or satoshis_total is None:
+            return self._reply_json( {'error' :
+                                      'Failed to get balance for {}'.format(get_address) },
+                                     status_code = 503 )
+        # step 2 -> unconfirmed balance = total - confirmed.
         #   this is replication of kind of silly insight-api behavior
         return self._reply_json( satoshis_total - satoshis_confirmed )
 
@@ -27,10 +27,13 @@ import keylib
 import re
 import json
 import hashlib
+import logging
 import urllib
 import urllib2
 import base64
 import time
+import functools
+import threading
 import jsontokens
 
 import blockstack_zones
@@ -54,6 +57,28 @@ log = get_logger()
 # global list of registered data handlers
 storage_handlers = []
 
+# maximum number of threads to fetch a single piece of data with
+STORAGE_FETCH_MAX_WORKERS = 8
+
+# maximum number of entries in each of the key caches below
+PUBKEY_CACHE_SIZE = 1024
+
+# decompressing a public key is an EC point operation, and we
+# see the same few keys over and over when fetching mutable data.
+# maps public key hex --> uncompressed public key hex
+PUBKEY_DECOMPRESS_CACHE = {}
+
+# likewise, hashing public keys into addresses and re-encoding
+# addresses are pure functions we repeat on every verification.
+# maps public key hex --> address
+PUBKEY_ADDRESS_CACHE = {}
+# maps address --> address with version byte 0
+VERSION0_ADDRESS_CACHE = {}
+
+# for sanity-checking serialized mutable data
+HEX_PATTERN = re.compile(r'^[0-9a-fA-F]+$')
+BASE64_PATTERN = re.compile(schemas.OP_BASE64_PATTERN_SECTION)
+
 
 class UnhandledURLException(Exception):
     def __init__(self, url):
@@ -61,15 +86,168 @@ class UnhandledURLException(Exception):
         self.unhandled_url = url
 
 
+def cached_call(cache, key, compute):
+    """
+    Look up @key in one of the bounded caches above,
+    calling compute(key) and caching the result on a miss.
+    The cache is emptied once it holds PUBKEY_CACHE_SIZE entries.
+    """
+    res = cache.get(key, None)
+    if res is not None:
+        return res
+
+    res = compute(key)
+
+    if len(cache) >= PUBKEY_CACHE_SIZE:
+        cache.clear()
+
+    cache[key] = res
+    return res
+
+
+def _decompress_pubkey_hex(pubkey_hex):
+    if keylib.key_formatting.get_pubkey_format(pubkey_hex) == 'hex_compressed':
+        return keylib.key_formatting.decompress(pubkey_hex)
+
+    return pubkey_hex
+
+
+def decompress_pubkey_hex(pubkey_hex):
+    """
+    Get the uncompressed form of a hex-encoded public key.
+    Uncompressed keys are returned as-is.
+    """
+    return cached_call(PUBKEY_DECOMPRESS_CACHE, pubkey_hex, _decompress_pubkey_hex)
+
+
+def pubkey_hex_to_address(pubkey_hex):
+    """
+    Get the address of a hex-encoded public key.
+    """
+    return cached_call(PUBKEY_ADDRESS_CACHE, pubkey_hex, keylib.public_key_to_address)
+
+
+def _get_version0_address(address):
+    return keylib.address_formatting.bin_hash160_to_address(
+        keylib.address_formatting.address_to_bin_hash160(address),
+        version_byte=0
+    )
+
+
+def get_version0_address(address):
+    """
+    Re-encode an address with version byte 0,
+    so it can be compared to the public key hashes in mutable data.
+    """
+    return cached_call(VERSION0_ADDRESS_CACHE, address, _get_version0_address)
+
+
+class StorageFetchPool(object):
+    """
+    Bounded pool of threads that run storage fetch calls, in order of preference.
+    The caller reads the results back in the same order, and calls stop() once
+    it has the answer it wants so the workers don't pick up any more fetches.
+
+    If no worker thread can be started, or none has gotten to a fetch yet,
+    get_result() runs the fetch in the caller's thread instead.
+    """
+    def __init__(self, fetch_calls, max_workers=STORAGE_FETCH_MAX_WORKERS):
+        self.fetch_calls = fetch_calls
+        self.results = [None] * len(fetch_calls)
+        self.finished = [threading.Event() for _ in fetch_calls]
+        self.next_fetch = 0
+        self.stopped = False
+        self.lock = threading.Lock()
+
+        num_workers = min(len(fetch_calls), max_workers)
+        for i in xrange(0, num_workers):
+            thr = threading.Thread(target=self.work)
+
+            # don't hold up process exit on a slow driver whose
+            # answer we didn't need
+            thr.daemon = True
+            try:
+                thr.start()
+            except threading.ThreadError as te:
+                log.warning('Failed to start storage fetch thread: %s', te)
+                break
+
+
+    def claim(self, last=None):
+        """
+        Claim the next fetch to run.
+        If @last is given, only claim fetches up to and including @last.
+        Return the index of the fetch, or None if there is nothing to do.
+        """
+        with self.lock:
+            if self.stopped or self.next_fetch >= len(self.fetch_calls):
+                return None
+
+            if last is not None and self.next_fetch > last:
+                return None
+
+            i = self.next_fetch
+            self.next_fetch += 1
+            return i
+
+
+    def run_fetch(self, i):
+        """
+        Run the ith fetch and post its result
+        """
+        try:
+            self.results[i] = self.fetch_calls[i]()
+        except Exception as e:
+            log.exception(e)
+            self.results[i] = None
+
+        self.finished[i].set()
+
+
+    def work(self):
+        """
+        Worker thread: run fetches until there are none left, or we're stopped
+        """
+        while True:
+            i = self.claim()
+            if i is None:
+                return
+
+            self.run_fetch(i)
+
+
+    def get_result(self, i):
+        """
+        Wait for and get the result of the ith fetch
+        """
+        while not self.finished[i].is_set():
+            j = self.claim(last=i)
+            if j is None:
+                break
+
+            self.run_fetch(j)
+
+        self.finished[i].wait()
+        return self.results[i]
+
+
+    def stop(self):
+        """
+        Don't start any more fetches
+        """
+        with self.lock:
+            self.stopped = True
+
+
 def get_data_hash(data_txt):
     """
     Generate a hash over data for immutable storage.
     Return the hex string.
     """
-    h = hashlib.sha256()
-    h.update(data_txt)
+    if isinstance(data_txt, unicode):
+        data_txt = data_txt.encode('utf-8')
 
-    return h.hexdigest()
+    return hashlib.sha256(data_txt).hexdigest()
 
 
 def get_zonefile_data_hash(data_txt):
@@ -89,9 +267,12 @@ def get_blockchain_compat_hash(data_txt):
     return hex_hash160(data_txt)
 
 
-def hash_zonefile(zonefile_json):
+def serialize_zonefile(zonefile_json):
     """
-    Given a JSON-ized zonefile, calculate its hash
+    Given a JSON-ized zonefile, serialize it and calculate its hash.
+    Callers that need both the text and the hash should use this
+    instead of serializing the zonefile a second time.
+    Return (zonefile text, hash)
     """
     assert '$origin' in zonefile_json.keys(), 'Missing $origin'
     assert '$ttl' in zonefile_json.keys(), 'Missing $ttl'
@@ -99,6 +280,14 @@ def hash_zonefile(zonefile_json):
     user_zonefile_txt = blockstack_zones.make_zone_file(zonefile_json)
     data_hash = get_zonefile_data_hash(user_zonefile_txt)
 
+    return user_zonefile_txt, data_hash
+
+
+def hash_zonefile(zonefile_json):
+    """
+    Given a JSON-ized zonefile, calculate its hash
+    """
+    _, data_hash = serialize_zonefile(zonefile_json)
     return data_hash
 
 
@@ -109,8 +298,9 @@ def verify_zonefile(zonefile_str, value_hash):
     """
     zonefile_hash = get_zonefile_data_hash(zonefile_str)
 
-    msg = 'Comparing zonefile hashes: expected {}, got {} ({})'
-    log.debug(msg.format(value_hash, zonefile_hash, zonefile_hash == value_hash))
+    if log.isEnabledFor(logging.DEBUG):
+        msg = 'Comparing zonefile hashes: expected %s, got %s (%s)'
+        log.debug(msg, value_hash, zonefile_hash, zonefile_hash == value_hash)
 
     return zonefile_hash == value_hash
 
@@ -200,7 +390,7 @@ def parse_data_payload( data_txt ):
     data_txt = data_txt[:-1]
     if len(data_txt) != payload_len:
         # not a valid netstring
-        log.debug("Invalid netstring: {} != {}".format(len(data_txt), payload_len))
+        log.debug("Invalid netstring: %s != %s", len(data_txt), payload_len)
         return None
 
     return data_txt
@@ -249,20 +439,18 @@ def parse_data_tombstone( signed_tombstone ):
     """
     Parse a signed data tombstone
     """
-    parts = signed_tombstone.rsplit(":", 1)
-    if len(parts) != 2:
+    tombstone_data, sep, sigb64 = signed_tombstone.rpartition(":")
+    if not sep:
         return {'error': 'Missing signature'}
 
-    tombstone_data, sigb64 = parts[0], parts[1]
     if not tombstone_data.startswith('delete-'):
         return {'error': 'Missing `delete` crib'}
 
     # strip `delete-${timestamp}:`
-    tombstone_payload_parts = tombstone_data.split(':', 1)
-    if len(tombstone_payload_parts) != 2:
+    _, sep, tombstone_payload = tombstone_data.partition(':')
+    if not sep:
         return {'error': 'Invalid `delete` crib'}
 
-    tombstone_payload = tombstone_payload_parts[1]
     return {'tombstone_payload': tombstone_payload, 'sigb64': sigb64}
 
 
@@ -270,11 +458,10 @@ def verify_data_tombstone( signed_tombstone, data_pubkey ):
     """
     Verify the authenticity of a data tombstone
     """
-    parts = signed_tombstone.rsplit(":", 1)
-    if len(parts) != 2:
+    tombstone_data, sep, sigb64 = signed_tombstone.rpartition(":")
+    if not sep:
         return False
 
-    tombstone_data, sigb64 = parts[0], parts[1]
     return verify_raw_data( tombstone_data, data_pubkey, sigb64 )
 
 
@@ -293,34 +480,28 @@ def parse_signed_data_tombstone( tombstone_data ):
        `ts` will be the number of milliseconds since the epoch date
     Return None on error
     """
-    parts1 = tombstone_data.split(":", 1)
-    if len(parts1) != 2:
-        return None
-
-    if not parts1[0].startswith('delete'):
-        return None
-    
-    if parts1[0].count('-') != 1:
+    header, sep, signed_id = tombstone_data.partition(":")
+    if not sep:
         return None
 
-    header_parts = parts1[0].split('-')
-    if len(header_parts) != 2:
+    if header.count('-') != 1:
         return None
 
-    if header_parts[0] != 'delete':
+    header_prefix, _, header_ts = header.partition('-')
+    if header_prefix != 'delete':
         return None
 
     ts = None
     try:
-        ts = int(header_parts[1])
+        ts = int(header_ts)
     except ValueError:
         return None
 
-    parts2 = parts1[1].rsplit(":", 1)
-    if len(parts2) != 2:
+    data_id, sep, signature = signed_id.rpartition(":")
+    if not sep:
         return None 
 
-    return {'id': parts2[0], 'signature': parts2[1], 'timestamp': ts}
+    return {'id': data_id, 'signature': signature, 'timestamp': ts}
 
 
 def serialize_mutable_data(data_text_or_json, data_privkey=None, data_pubkey=None, data_signature=None, profile=False):
@@ -387,7 +568,7 @@ def parse_mutable_data_v2(mutable_data_json_txt, public_key_hex, public_key_hash
         # format: bsk2.pubkey.sigb64.data_len:data,
         parts = mutable_data_json_txt.split(".", 3)
         if len(parts) != 4:
-            log.debug("Malformed data: {}".format(mutable_data_json_txt))
+            log.debug("Malformed data: %s", mutable_data_json_txt)
             return None 
         
         if parts[0] != 'bsk2':
@@ -399,11 +580,11 @@ def parse_mutable_data_v2(mutable_data_json_txt, public_key_hex, public_key_hash
         data_txt = str(parts[3])
 
         # basic sanity checks
-        if not re.match('^[0-9a-fA-F]+$', pubk_hex):
+        if not HEX_PATTERN.match(pubk_hex):
             log.debug("Not a v2 mutable datum: Invalid public key")
             return None 
 
-        if not re.match(schemas.OP_BASE64_PATTERN_SECTION, sig_b64):
+        if not BASE64_PATTERN.match(sig_b64):
             log.debug("Not a v2 mutable datum: Invalid signature data")
             return None
 
@@ -415,10 +596,10 @@ def parse_mutable_data_v2(mutable_data_json_txt, public_key_hex, public_key_hash
 
         # data_txt must be a netstring (format: 'len(payload):payload,')
         serialized_len = len(data_txt)
-        original_data_txt = data_txt[:]
+        original_data_txt = data_txt
         data_txt = parse_data_payload(data_txt)
         if data_txt is None:
-            log.debug("Invalid data payload of {} bytes".format(serialized_len))
+            log.debug("Invalid data payload of %s bytes", serialized_len)
             return None
 
     else:
@@ -427,10 +608,10 @@ def parse_mutable_data_v2(mutable_data_json_txt, public_key_hex, public_key_hash
 
     # shortcut: if hash is given, we're done 
     if data_hash is not None:
-        dh = hash_data_payload( str(data_txt) )
+        dh = hash_data_payload( data_txt )
         if dh == data_hash:
             # done!
-            log.debug("Verified with hash {}".format(data_hash))
+            log.debug("Verified with hash %s", data_hash)
 
             if return_public_key:
                 return {'data': data_txt, 'public_key': None}
@@ -438,25 +619,26 @@ def parse_mutable_data_v2(mutable_data_json_txt, public_key_hex, public_key_hash
                 return data_txt
 
         else:
-            log.debug("Hash mismatch: expected {}, got {}\noriginal_data_text ({}): '{}'\nlen(original_data_text): {}\nparsed payload: '{}'\nhash_data_payload: {}".format(
-                data_hash, dh, type(original_data_txt), original_data_txt, len(original_data_txt), parse_data_payload(original_data_txt), hash_data_payload(data_txt)))
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Hash mismatch: expected %s, got %s\noriginal_data_text (%s): '%s'\nlen(original_data_text): %s\nparsed payload: '%s'\nhash_data_payload: %s",
+                    data_hash, dh, type(original_data_txt), original_data_txt, len(original_data_txt), parse_data_payload(original_data_txt), hash_data_payload(data_txt))
     
     # validate 
     if pubk_hex is not None:
-        if keylib.key_formatting.get_pubkey_format(pubk_hex) == 'hex_compressed':
-            pubk_hex = keylib.key_formatting.decompress(pubk_hex)
+        pubk_hex = decompress_pubkey_hex(pubk_hex)
+
+    # set if the signature already failed to verify against pubk_hex
+    signature_failed = False
 
     if public_key_hex is not None:
         # make sure uncompressed
-        given_pubkey_hex = str(public_key_hex)
-        if keylib.key_formatting.get_pubkey_format(given_pubkey_hex) == 'hex_compressed':
-            given_pubkey_hex = keylib.key_formatting.decompress(given_pubkey_hex)
+        given_pubkey_hex = decompress_pubkey_hex(str(public_key_hex))
 
-        log.debug("Try verify with {}".format(given_pubkey_hex))
+        log.debug("Try verify with %s", given_pubkey_hex)
 
         if pubk_hex is not None and given_pubkey_hex == pubk_hex:
             if verify_data_payload( data_txt, pubk_hex, sig_b64 ):
-                log.debug("Verified payload with public key {}".format(pubk_hex))
+                log.debug("Verified payload with public key %s", pubk_hex)
 
                 if return_public_key:
                     return {'data': data_txt, 'public_key': pubk_hex}
@@ -464,26 +646,26 @@ def parse_mutable_data_v2(mutable_data_json_txt, public_key_hex, public_key_hash
                     return data_txt
             else:
                 log.debug("Signature failed")
+                signature_failed = True
 
         else:
-            log.debug("Public key mismatch: {} != {}".format(given_pubkey_hex, pubk_hex))
+            log.debug("Public key mismatch: %s != %s", given_pubkey_hex, pubk_hex)
 
     if public_key_hash is not None and pubk_hex is not None:
-        pubkey_hash = keylib.address_formatting.bin_hash160_to_address(
-                keylib.address_formatting.address_to_bin_hash160(
-                    str(public_key_hash),
-                ),
-                version_byte=0
-        )
+        pubkey_hash = get_version0_address(str(public_key_hash))
 
-        log.debug("Try verify with {}".format(pubkey_hash))
+        log.debug("Try verify with %s", pubkey_hash)
 
+        # pubk_hex is already uncompressed
         pubk_compressed = keylib.key_formatting.compress(pubk_hex)
-        pubk_uncompressed = keylib.key_formatting.decompress(pubk_hex)
 
-        if keylib.public_key_to_address(pubk_compressed) == pubkey_hash or keylib.public_key_to_address(pubk_uncompressed) == pubkey_hash:
-            if verify_data_payload( data_txt, pubk_hex, sig_b64 ):
-                log.debug("Verified payload with public key hash {} ({})".format(pubk_hex, pubkey_hash))
+        if pubkey_hex_to_address(pubk_compressed) == pubkey_hash or pubkey_hex_to_address(pubk_hex) == pubkey_hash:
+            if signature_failed:
+                # same key, same signature; it won't verify this time either
+                log.debug("Signature failed with pubkey hash (already tried public key)")
+
+            elif verify_data_payload( data_txt, pubk_hex, sig_b64 ):
+                log.debug("Verified payload with public key hash %s (%s)", pubk_hex, pubkey_hash)
 
                 if return_public_key:
                     return {'data': data_txt, 'public_key': pubk_hex}
@@ -554,37 +736,38 @@ def parse_mutable_data(mutable_data_json_txt, public_key, public_key_hash=None,
             else:
                 return mutable_data_json
 
-        msg = 'Failed to verify with public key "{}"'
-        log.warn(msg.format(public_key))
+        msg = 'Failed to verify with public key "%s"'
+        log.warn(msg, public_key)
 
     # try pubkey address
     if public_key_hash is not None:
         # NOTE: these should always have version byte 0
         # TODO: use jsontokens directly
-        public_key_hash_0 = keylib.address_formatting.bin_hash160_to_address(
-            keylib.address_formatting.address_to_bin_hash160(
-                str(public_key_hash)
-            ),
-            version_byte=0
-        )
+        public_key_hash_0 = get_version0_address(str(public_key_hash))
 
         mutable_data_json = blockstack_profiles.get_profile_from_tokens(
             mutable_data_jwt, public_key_hash_0
         )
 
         if len(mutable_data_json) > 0:
-            log.debug('Verified with {}'.format(public_key_hash))
+            log.debug('Verified with %s', public_key_hash)
             if return_public_key:
                 profile_token = jsontokens.decode_token(mutable_data_jwt[0]['token'])
                 issuer_public_key = profile_token['payload']['issuer']['publicKey']
 
                 # use the one that corresponds to the address 
                 ret_pubkey = None
-                if virtualchain.address_reencode(keylib.public_key_to_address(keylib.key_formatting.compress(str(issuer_public_key)))) == virtualchain.address_reencode(str(public_key_hash)):
-                    ret_pubkey = keylib.key_formatting.compress(issuer_public_key)
-                elif virtualchain.address_reencode(keylib.public_key_to_address(keylib.key_formatting.decompress(str(issuer_public_key)))) == virtualchain.address_reencode(str(public_key_hash)):
-                    ret_pubkey = keylib.key_formatting.decompress(issuer_public_key)
+                expected_address = virtualchain.address_reencode(str(public_key_hash))
+                issuer_public_key_compressed = keylib.key_formatting.compress(str(issuer_public_key))
+
+                if virtualchain.address_reencode(pubkey_hex_to_address(issuer_public_key_compressed)) == expected_address:
+                    ret_pubkey = issuer_public_key_compressed
                 else:
+                    issuer_public_key_uncompressed = decompress_pubkey_hex(str(issuer_public_key))
+                    if virtualchain.address_reencode(pubkey_hex_to_address(issuer_public_key_uncompressed)) == expected_address:
+                        ret_pubkey = issuer_public_key_uncompressed
+
+                if ret_pubkey is None:
                     raise Exception("BUG: public key {} does not match {}".format(issuer_public_key, public_key_hash))
 
                 return {'data': mutable_data_json, 'public_key': ret_pubkey}
@@ -592,8 +775,8 @@ def parse_mutable_data(mutable_data_json_txt, public_key, public_key_hash=None,
             else:
                 return mutable_data_json
 
-        msg = 'Failed to verify with public key hash "{}" ("{}")'
-        log.warn(msg.format(public_key_hash, public_key_hash_0))
+        msg = 'Failed to verify with public key hash "%s" ("%s")'
+        log.warn(msg, public_key_hash, public_key_hash_0)
 
     # try sha256 hash 
     if data_hash is not None:
@@ -629,8 +812,8 @@ def register_storage(storage_impl):
 
     for expected_method in expected_methods:
         if not getattr(storage_impl, expected_method, None):
-            msg = 'Storage implementation is missing a "{}" method'
-            log.warning(msg.format(expected_method))
+            msg = 'Storage implementation is missing a "%s" method'
+            log.warning(msg, expected_method)
 
     return True
 
@@ -648,12 +831,12 @@ def get_storage_driver_classes(driver_name):
     for driver in storage_handlers:
         if driver.__name__ == driver_name:
             if not hasattr(driver, 'get_classes'):
-                log.warn("Driver {} does not implement 'get_classes()'".format(driver_name))
+                log.warn("Driver %s does not implement 'get_classes()'", driver_name)
                 return []
 
             return driver.get_classes()
 
-    log.warn("No such driver {}".format(driver_name))
+    log.warn("No such driver %s", driver_name)
     return []
 
 
@@ -696,12 +879,12 @@ def configure_storage_driver(driver_name, index=False, force_index=False, config
         if driver.__name__ == driver_name:
             res = driver.storage_init(conf, index=index, force_index=force_index)
             if not res:
-                log.error("Failed to configure {}".format(driver_name))
+                log.error("Failed to configure %s", driver_name)
                 return {'error': 'Failed to configure driver', 'status': False}
 
             return {'status': True}
 
-    log.error("No such driver {}".format(driver_name))
+    log.error("No such driver %s", driver_name)
     return {'error': 'No such driver'}
 
 
@@ -733,63 +916,85 @@ def get_immutable_data(data_hash, data_url=None, hash_func=get_data_hash, fqu=No
                 h for h in storage_handlers if h.__name__ == d
             )
 
-    log.debug('get_immutable {}'.format(data_hash))
+    log.debug('get_immutable %s', data_hash)
+
+    def _fetch_data_url():
+        """
+        Fetch from the URL hint (fetch worker)
+        """
+        try:
+            # assume it's something we can urlopen
+            urlh = urllib2.urlopen(data_url)
+            data = urlh.read()
+            urlh.close()
+            return data
+        except Exception as e:
+            log.exception(e)
+            msg = 'Failed to load profile from "%s"'
+            log.error(msg, data_url)
+            return None
+
+    def _fetch_handler(handler):
+        """
+        Fetch from a storage handler (fetch worker)
+        """
+        log.debug('Try %s (%s)', handler.__name__, data_hash)
+        try:
+            return handler.get_immutable_handler(
+                data_hash, data_id=data_id, zonefile=zonefile, fqu=fqu
+            )
+        except Exception as e:
+            log.exception(e)
+            log.debug('Method failed: %s.get_immutable_handler(%s)', handler, data_hash)
+            return None
+
+    # (source name, fetch call), in order of preference
+    sources = []
+    if data_url is not None:
+        sources.append((data_url, _fetch_data_url))
 
-    for handler in [data_url] + handlers_to_use:
-        if handler is None:
+    for handler in handlers_to_use:
+        if not getattr(handler, 'get_immutable_handler', None):
+            log.debug('No method: %s.get_immutable_handler(%s)', handler, data_hash)
             continue
 
-        data, data_dict = None, None
+        sources.append((handler.__name__, functools.partial(_fetch_handler, handler)))
 
-        if handler == data_url:
-            # url hint
-            try:
-                # assume it's something we can urlopen
-                urlh = urllib2.urlopen(data_url)
-                data = urlh.read()
-                urlh.close()
-            except Exception as e:
-                log.exception(e)
-                msg = 'Failed to load profile from "{}"'
-                log.error(msg.format(data_url))
-                continue
-        else:
-            # handler
-            if not getattr(handler, 'get_immutable_handler', None):
-                msg = 'No method: {}.get_immutable_handler({})'
-                log.debug(msg.format(handler, data_hash))
-                continue
+    # ask a few sources at once, but take the most-preferred valid answer
+    fetches = StorageFetchPool(
+        [fetch for (_, fetch) in sources],
+        max_workers=min(max(len(handlers_to_use), 1), STORAGE_FETCH_MAX_WORKERS)
+    )
 
-            log.debug('Try {} ({})'.format(handler.__name__, data_hash))
-            try:
-                data = handler.get_immutable_handler(
-                    data_hash, data_id=data_id, zonefile=zonefile, fqu=fqu
-                )
-            except Exception as e:
-                log.exception(e)
-                msg = 'Method failed: {}.get_immutable_handler({})'
-                log.debug(msg.format(handler, data_hash))
-                continue
+    # data that failed hash validation.
+    # drivers often replicate the same bytes, so don't re-hash them.
+    invalid_data = set()
 
+    for i, (source_name, _) in enumerate(sources):
+        data = fetches.get_result(i)
         if data is None:
-            msg = 'No data: {}.get_immutable_handler({})'
-            log.debug(msg.format(handler.__name__, data_hash))
+            log.debug('No data: %s.get_immutable_handler(%s)', source_name, data_hash)
             continue
 
         # validate
-        dh = hash_func(data)
+        dh = None
+        if data not in invalid_data:
+            dh = hash_func(data)
+
         if dh != data_hash:
+            invalid_data.add(data)
             # nope
-            if handler == data_url:
-                msg = 'Invalid data hash from "{}"'
-                log.error(msg.format(data_url))
+            if source_name == data_url:
+                msg = 'Invalid data hash from "%s"'
+                log.error(msg, data_url)
             else:
-                msg = 'Invalid data hash from {}.get_immutable_handler'
-                log.error(msg.format(handler.__name__))
+                msg = 'Invalid data hash from %s.get_immutable_handler'
+                log.error(msg, source_name)
 
             continue
 
-        log.debug('loaded {} with {}'.format(data_hash, handler.__name__))
+        log.debug('loaded %s with %s', data_hash, source_name)
+        fetches.stop()
         return data
 
     return None
@@ -868,10 +1073,18 @@ def get_mutable_data(fq_data_id, data_pubkey, urls=None, data_address=None, data
             h = keylib.b58check.b58check_decode(str(a)).encode('hex')
             data_pubkey_hashes.append(h)
         except:
-            log.debug("Invalid address '{}'".format(a))
+            log.debug("Invalid address '%s'", a)
             continue
 
-    log.debug('get_mutable_data {} fqu={} bsk_version={}'.format(fq_data_id, fqu, bsk_version))
+    # payloads that failed to parse or verify.
+    # drivers often replicate the same bytes, so don't re-verify them.
+    unparseable_payloads = set()
+
+    log.debug('get_mutable_data %s fqu=%s bsk_version=%s', fq_data_id, fqu, bsk_version)
+
+    # (storage handler, URL) to try, in order of preference
+    sources = []
+
     for storage_handler in handlers_to_use:
         if not getattr(storage_handler, 'get_mutable_handler', None):
             continue
@@ -881,21 +1094,21 @@ def get_mutable_data(fq_data_id, data_pubkey, urls=None, data_address=None, data
         if urls is None:
             # make one on-the-fly
             if not getattr(storage_handler, 'make_mutable_url', None):
-                msg = 'Storage handler {} does not support `{}`'
-                log.warning(msg.format(storage_handler.__name__, 'make_mutable_url'))
+                msg = 'Storage handler %s does not support `%s`'
+                log.warning(msg, storage_handler.__name__, 'make_mutable_url')
                 continue
 
             new_url = None
 
             try:
                 new_url = storage_handler.make_mutable_url(fq_data_id)
-                log.debug("{} available at {}".format(fq_data_id, new_url))
+                log.debug("%s available at %s", fq_data_id, new_url)
             except Exception as e:
                 log.exception(e)
                 continue
 
             if new_url is None:
-                log.debug("Cannot use {} to generate a URL for {}".format(storage_handler.__name__, fq_data_id))
+                log.debug("Cannot use %s to generate a URL for %s", storage_handler.__name__, fq_data_id)
                 continue
 
             try_urls = [new_url]
@@ -904,69 +1117,85 @@ def get_mutable_data(fq_data_id, data_pubkey, urls=None, data_address=None, data
             # find the set that this handler can manage
             for url in urls:
                 if not getattr(storage_handler, 'handles_url', None):
-                    msg = 'Storage handler {} does not support `{}`'
-                    log.warning(msg.format(storage_handler.__name__, 'handles_url'))
+                    msg = 'Storage handler %s does not support `%s`'
+                    log.warning(msg, storage_handler.__name__, 'handles_url')
                     continue
 
                 if storage_handler.handles_url(url):
-                    log.debug("{} supports URL {}".format(storage_handler.__name__, url))
+                    log.debug("%s supports URL %s", storage_handler.__name__, url)
                     try_urls.append(url)
 
         for url in try_urls:
-            data_txt, data_res = None, None
+            sources.append((storage_handler, url))
 
-            log.debug('Try {} ({})'.format(storage_handler.__name__, url))
-            try:
-                data_txt = storage_handler.get_mutable_handler(url, fqu=fqu, data_pubkey=data_pubkey, data_pubkey_hashes=data_pubkey_hashes)
-            except UnhandledURLException as uue:
-                # handler doesn't handle this URL
-                msg = 'Storage handler {} does not handle URLs like {}'
-                log.debug(msg.format(storage_handler.__name__, url))
-                continue
-            except Exception as e:
-                log.exception(e)
-                continue
+    def _fetch(storage_handler, url):
+        """
+        Fetch from a storage handler (fetch worker)
+        """
+        log.debug('Try %s (%s)', storage_handler.__name__, url)
+        try:
+            return storage_handler.get_mutable_handler(url, fqu=fqu, data_pubkey=data_pubkey, data_pubkey_hashes=data_pubkey_hashes)
+        except UnhandledURLException as uue:
+            # handler doesn't handle this URL
+            log.debug('Storage handler %s does not handle URLs like %s', storage_handler.__name__, url)
+            return None
+        except Exception as e:
+            log.exception(e)
+            return None
 
-            if data_txt is None:
-                # no data
-                msg = 'No data from {} ({})'
-                log.debug(msg.format(storage_handler.__name__, url))
+    # ask a few sources at once, but take the most-preferred valid answer
+    fetches = StorageFetchPool(
+        [functools.partial(_fetch, storage_handler, url) for (storage_handler, url) in sources],
+        max_workers=min(max(len(handlers_to_use), 1), STORAGE_FETCH_MAX_WORKERS)
+    )
+
+    for i, (storage_handler, url) in enumerate(sources):
+        data_res = None
+        data_txt = fetches.get_result(i)
+        if data_txt is None:
+            # no data
+            log.debug('No data from %s (%s)', storage_handler.__name__, url)
+            continue
+
+        # parse it, if desired
+        if decode:
+            if data_txt in unparseable_payloads:
+                msg = 'Unparseable data from "%s" (already tried)'
+                log.error(msg, url)
                 continue
 
-            # parse it, if desired
-            if decode:
-                data_res = None
-                if data_pubkey is not None or data_address is not None or data_hash is not None:
-                    data_res = parse_mutable_data(
-                        data_txt, data_pubkey, public_key_hash=data_address, data_hash=data_hash, bsk_version=bsk_version, return_public_key=return_public_key
-                    )
-
-                if data_res is None and owner_address is not None:
-                    data_res = parse_mutable_data(
-                        data_txt, None, public_key_hash=owner_address, bsk_version=bsk_version, return_public_key=return_public_key
-                    )
-
-                if data_res is None:
-                    msg = 'Unparseable data from "{}"'
-                    log.error(msg.format(url))
-                    continue
+            data_res = None
+            if data_pubkey is not None or data_address is not None or data_hash is not None:
+                data_res = parse_mutable_data(
+                    data_txt, data_pubkey, public_key_hash=data_address, data_hash=data_hash, bsk_version=bsk_version, return_public_key=return_public_key
+                )
+
+            if data_res is None and owner_address is not None:
+                data_res = parse_mutable_data(
+                    data_txt, None, public_key_hash=owner_address, bsk_version=bsk_version, return_public_key=return_public_key
+                )
 
-                msg = 'Loaded "{}" with {}'
-                log.debug(msg.format(url, storage_handler.__name__))
+            if data_res is None:
+                msg = 'Unparseable data from "%s"'
+                log.error(msg, url)
+                unparseable_payloads.add(data_txt)
+                continue
+
+            log.debug('Loaded "%s" with %s', url, storage_handler.__name__)
 
-                if BLOCKSTACK_TEST:
-                    log.debug("loaded data: {}".format(data_res))
+            if BLOCKSTACK_TEST:
+                log.debug("loaded data: %s", data_res)
 
+        else:
+            if return_public_key:
+                data_res = {'data': data_txt, 'public_key': None}
             else:
-                if return_public_key:
-                    data_res = {'data': data_txt, 'public_key': None}
-                else:
-                    data_res = data_txt
+                data_res = data_txt
 
-                msg = 'Fetched (but did not decode or verify) "{}" with "{}"'
-                log.debug(msg.format(url, storage_handler.__name__))
+            log.debug('Fetched (but did not decode or verify) "%s" with "%s"', url, storage_handler.__name__)
 
-            return data_res
+        fetches.stop()
+        return data_res
 
     return None
 
@@ -994,14 +1223,14 @@ def put_immutable_data(data_text, txid, data_hash=None, required=None, skip=None
     successes = 0
     required_successes = 0
 
-    msg = 'put_immutable_data({}), required={}, skip={}'
-    log.debug(msg.format(data_hash, ','.join(required), ','.join(skip)))
+    msg = 'put_immutable_data(%s), required=%s, skip=%s'
+    log.debug(msg, data_hash, ','.join(required), ','.join(skip))
 
     for handler in storage_handlers:
         if required_exclusive and handler.__name__ not in required:
             continue
         if handler.__name__ in skip:
-            log.debug("Skipping {}".format(handler.__name__))
+            log.debug("Skipping %s", handler.__name__)
             continue
 
         if not getattr(handler, 'put_immutable_handler', None):
@@ -1009,13 +1238,13 @@ def put_immutable_data(data_text, txid, data_hash=None, required=None, skip=None
                 continue
 
             # this one failed. fatal
-            log.debug("Storage provider {} is required but does not allow immutable storage".format(handler.__name__))
+            log.debug("Storage provider %s is required but does not allow immutable storage", handler.__name__)
             return None
 
         rc = False
 
         try:
-            log.debug('Try "{}"'.format(handler.__name__))
+            log.debug('Try "%s"', handler.__name__)
             rc = handler.put_immutable_handler(data_hash, data_text, txid)
         except Exception as e:
             log.exception(e)
@@ -1023,11 +1252,11 @@ def put_immutable_data(data_text, txid, data_hash=None, required=None, skip=None
                 continue
 
             # fatal
-            log.debug("Failed to replicate to required storage provider {}".format(handler.__name__))
+            log.debug("Failed to replicate to required storage provider %s", handler.__name__)
             return None
 
         if not rc:
-            log.debug('Failed to replicate with "{}"'.format(handler.__name__))
+            log.debug('Failed to replicate with "%s"', handler.__name__)
             if handler.__name__ not in required:
                 continue
 
@@ -1035,7 +1264,7 @@ def put_immutable_data(data_text, txid, data_hash=None, required=None, skip=None
             return None
 
         else:
-            log.debug('Replication succeeded with "{}"'.format(handler.__name__))
+            log.debug('Replication succeeded with "%s"', handler.__name__)
             successes += 1
 
             if handler.__name__ in required:
@@ -1073,7 +1302,7 @@ def put_mutable_data(fq_data_id, data_text_or_json, sign=True, raw=False, data_p
 
     assert len(set(required).intersection(set(skip))) == 0, "Overlap between required and skip driver lists"
 
-    log.debug('put_mutable_data({}), required={}, skip={} required_exclusive={}'.format(fq_data_id, ','.join(required), ','.join(skip), required_exclusive))
+    log.debug('put_mutable_data(%s), required=%s, skip=%s required_exclusive=%s', fq_data_id, ','.join(required), ','.join(skip), required_exclusive)
 
     # fully-qualified username hint
     fqu = None
@@ -1099,7 +1328,7 @@ def put_mutable_data(fq_data_id, data_text_or_json, sign=True, raw=False, data_p
         serialized_data = data_text_or_json
 
     if BLOCKSTACK_TEST:
-        log.debug("data ({}): {}".format(type(serialized_data), serialized_data))
+        log.debug("data (%s): %s", type(serialized_data), serialized_data)
 
     successes = 0
     required_successes = 0
@@ -1108,15 +1337,15 @@ def put_mutable_data(fq_data_id, data_text_or_json, sign=True, raw=False, data_p
 
     for handler in storage_handlers:
         if handler.__name__ in skip:
-            log.debug("Skipping {}: at caller's request".format(handler.__name__))
+            log.debug("Skipping %s: at caller's request", handler.__name__)
             continue
 
         if not getattr(handler, 'put_mutable_handler', None):
             if handler.__name__ not in required:
-                log.debug("Skipping {}: it does not implement put_mutable_handler".format(handler.__name__))
+                log.debug("Skipping %s: it does not implement put_mutable_handler", handler.__name__)
                 continue
 
-            log.debug("Required storage provider {} does not implement put_mutable_handler".format(handler.__name__))
+            log.debug("Required storage provider %s does not implement put_mutable_handler", handler.__name__)
             return False
 
         if required_exclusive and handler.__name__ not in required:
@@ -1124,7 +1353,7 @@ def put_mutable_data(fq_data_id, data_text_or_json, sign=True, raw=False, data_p
             continue
 
         rc = False
-        log.debug('Try "{}"'.format(handler.__name__))
+        log.debug('Try "%s"', handler.__name__)
 
         try:
             rc = handler.put_mutable_handler(fq_data_id, serialized_data, fqu=fqu, profile=profile)
@@ -1133,11 +1362,11 @@ def put_mutable_data(fq_data_id, data_text_or_json, sign=True, raw=False, data_p
             if handler.__name__ not in required:
                 continue
 
-            log.error("Failed to replicate data with '{}'".format(handler.__name__))
+            log.error("Failed to replicate data with '%s'", handler.__name__)
             return None
 
         if rc:
-            log.debug("Replicated {} bytes with {} (rc = {})".format(len(serialized_data), handler.__name__, rc))
+            log.debug("Replicated %s bytes with %s (rc = %s)", len(serialized_data), handler.__name__, rc)
             successes += 1
 
             if handler.__name__ in required:
@@ -1146,19 +1375,19 @@ def put_mutable_data(fq_data_id, data_text_or_json, sign=True, raw=False, data_p
             continue
 
         if handler.__name__ not in required:
-            log.debug('Failed to replicate with "{}"'.format(handler.__name__))
+            log.debug('Failed to replicate with "%s"', handler.__name__)
             continue
 
         # required driver failed
-        log.error("Failed to replicate to required storage provider '{}'".format(handler.__name__))
+        log.error("Failed to replicate to required storage provider '%s'", handler.__name__)
         return False
 
     if len(skipped_optionals) > 1:
-        log.debug("Skipped optional drivers: [{}]".format(",".join(skipped_optionals)))
+        log.debug("Skipped optional drivers: [%s]", ",".join(skipped_optionals))
     # failed everywhere or succeeded somewhere
-    log.debug("put_mutable_data: successes = {}, required_successes = {}, |required - skip| = {}".format(
+    log.debug("put_mutable_data: successes = %s, required_successes = %s, |required - skip| = %s",
         successes, required_successes, len(set(required) - set(skip))
-    ))
+    )
 
     return (successes > 0) and (required_successes >= len(set(required) - set(skip)))
 
@@ -1234,14 +1463,14 @@ def delete_mutable_data(fq_data_id, privatekey=None, signed_data_tombstone=None,
     # remove data
     for handler in storage_handlers:
         if handler.__name__ in skip:
-            log.debug("Skipping {}".format(handler.__name__))
+            log.debug("Skipping %s", handler.__name__)
             continue
 
         if not getattr(handler, 'delete_mutable_handler', None):
             continue
 
         if required_exclusive and handler.__name__ not in required:
-            log.debug("Skipping non-required driver {}".format(handler.__name__))
+            log.debug("Skipping non-required driver %s", handler.__name__)
             continue
 
         rc = False
@@ -1252,7 +1481,7 @@ def delete_mutable_data(fq_data_id, privatekey=None, signed_data_tombstone=None,
             rc = False
 
         if not rc and handler.__name__ in required:
-            log.error("Failed to delete from required storage driver {}".format(handler.__name__))
+            log.error("Failed to delete from required storage driver %s", handler.__name__)
             return False
         
         elif handler.__name__ in required:
@@ -1276,7 +1505,7 @@ def get_announcement(announcement_hash):
     )
 
     if data is None:
-        log.error('Failed to get announcement "{}"'.format(announcement_hash))
+        log.error('Failed to get announcement "%s"', announcement_hash)
         return None
 
     return data
@@ -1295,7 +1524,7 @@ def put_announcement(announcement_text, txid):
     data_hash = get_blockchain_compat_hash(announcement_text)
     res = put_immutable_data(announcement_text, txid, data_hash=data_hash)
     if res is None:
-        log.error('Failed to put announcement "{}"'.format(data_hash))
+        log.error('Failed to put announcement "%s"', data_hash)
         return None
 
     return data_hash
@@ -1313,8 +1542,8 @@ def parse_fq_data_id(fq_data_id):
     Parse a fully-qualified data ID
     """
     fq_data_id = urllib.unquote(fq_data_id).replace('\\x2f', '/')
-    parts = fq_data_id.split(":", 1)
-    if len(parts) != 2:
+    device_id, sep, data_id = fq_data_id.partition(":")
+    if not sep:
         return None, None
 
-    return parts[0], parts[1]
+    return device_id, data_id
@@ -107,7 +107,8 @@ def satoshis_to_btc(satoshis):
 
 def btc_to_satoshis(btc):
 
-    return int(btc / 0.00000001)
+    # round, don't truncate: 0.29 / 0.00000001 == 28999999.999999996
+    return int(round(btc * 10**8))
 
 
 def daemonize( logpath, child_wait=None ):
@@ -335,14 +336,14 @@ class ScatterGatherThread(threading.Thread):
         Run the given RPC call and post the result
         """
         try:
-            log.debug("Run task {}".format(rpc_call))
+            log.debug("Run task %s", rpc_call)
             res = rpc_call()
-            log.debug("Task exit {}".format(rpc_call))
+            log.debug("Task exit %s", rpc_call)
             return res
 
         except Exception as e:
             log.exception(e)
-            log.debug("Task exit {}".format(rpc_call))
+            log.debug("Task exit %s", rpc_call)
             return {'error': 'Task encountered a fatal exception:\n{}'.format(traceback.format_exc())}
 
 
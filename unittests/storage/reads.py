@@ -0,0 +1,149 @@
+#!/usr/bin/env python2
+# -*- coding: utf-8 -*-
+"""
+    Blockstack-client
+    ~~~~~
+
+    copyright: (c) 2017 by Blockstack.org
+
+    This file is part of Blockstack-client.
+
+    Blockstack-client is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Blockstack-client is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Blockstack-client. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import unittest, time, types, StringIO
+
+from blockstack_client import storage
+
+
+def make_driver(name, data, delay=0, fail=False):
+    """
+    Make a stub storage driver module that serves @data after @delay seconds
+    """
+    driver = types.ModuleType(name)
+
+    def _get(*args, **kw):
+        time.sleep(delay)
+        if fail:
+            raise Exception('{} failed'.format(name))
+
+        return data
+
+    driver.get_immutable_handler = _get
+    driver.get_mutable_handler = _get
+    driver.make_mutable_url = lambda fq_data_id: '{}://{}'.format(name, fq_data_id)
+    return driver
+
+
+class StorageReads(unittest.TestCase):
+    def setUp(self):
+        self.old_handlers = storage.storage_handlers[:]
+        self.old_urlopen = storage.urllib2.urlopen
+
+    def tearDown(self):
+        storage.storage_handlers[:] = self.old_handlers
+        storage.urllib2.urlopen = self.old_urlopen
+
+    def test_immutable_preferred_source_wins(self):
+        good = 'hello world'
+        data_hash = storage.get_data_hash(good)
+        storage.storage_handlers[:] = [
+            make_driver('slow', good, delay=0.5),
+            make_driver('fast', good),
+        ]
+
+        self.assertEqual(storage.get_immutable_data(data_hash), good)
+
+        # both are "valid" under this hash function, so the preferred one must win
+        storage.storage_handlers[:] = [
+            make_driver('slow', 'slow data', delay=0.5),
+            make_driver('fast', 'fast data'),
+        ]
+        res = storage.get_immutable_data('00', hash_func=lambda d: '00')
+        self.assertEqual(res, 'slow data')
+
+    def test_immutable_falls_through(self):
+        good = 'hello world'
+        data_hash = storage.get_data_hash(good)
+        storage.storage_handlers[:] = [
+            make_driver('broken', None, fail=True),
+            make_driver('invalid', 'not hello world'),
+            make_driver('missing', None),
+            make_driver('good', good, delay=0.1),
+        ]
+
+        self.assertEqual(storage.get_immutable_data(data_hash), good)
+        self.assertIsNone(storage.get_immutable_data(storage.get_data_hash('nope')))
+
+    def test_immutable_data_url_first(self):
+        storage.storage_handlers[:] = [
+            make_driver('driver', 'driver data'),
+        ]
+
+        def _urlopen(url):
+            time.sleep(0.2)
+            return StringIO.StringIO('url data')
+
+        storage.urllib2.urlopen = _urlopen
+        res = storage.get_immutable_data('00', data_url='http://example.com/data', hash_func=lambda d: '00')
+        self.assertEqual(res, 'url data')
+
+    def test_mutable_preferred_source_wins(self):
+        storage.storage_handlers[:] = [
+            make_driver('slow', 'slow data', delay=0.5),
+            make_driver('fast', 'fast data'),
+        ]
+
+        self.assertEqual(storage.get_mutable_data('foo', None, decode=False), 'slow data')
+
+    def test_mutable_falls_through(self):
+        storage.storage_handlers[:] = [
+            make_driver('broken', None, fail=True),
+            make_driver('missing', None),
+            make_driver('good', 'good data', delay=0.1),
+        ]
+
+        self.assertEqual(storage.get_mutable_data('foo', None, decode=False), 'good data')
+
+    def test_fetch_pool_without_threads(self):
+        calls = []
+        def _fetch(i):
+            calls.append(i)
+            return i
+
+        fetches = storage.StorageFetchPool([lambda i=i: _fetch(i) for i in range(0, 4)], max_workers=0)
+        self.assertEqual(fetches.get_result(2), 2)
+        self.assertEqual(calls, [0, 1, 2])
+
+        fetches.stop()
+        self.assertEqual(calls, [0, 1, 2])
+
+    def test_fetch_pool_thread_start_fails(self):
+        def _start(thr):
+            raise storage.threading.ThreadError("can't start new thread")
+
+        old_start = storage.threading.Thread.start
+        storage.threading.Thread.start = _start
+        try:
+            storage.storage_handlers[:] = [
+                make_driver('missing', None),
+                make_driver('good', 'good data'),
+            ]
+            self.assertEqual(storage.get_mutable_data('foo', None, decode=False), 'good data')
+        finally:
+            storage.threading.Thread.start = old_start
+
+
+if __name__ == '__main__':
+    unittest.main()